@@ -36,7 +36,7 @@ class ServiceBase(ABC):
     
     def dispatch(self, event_type: str, payload: Any, priority: Priority = Priority.NORMAL):
         if not self._running.is_set():
-            self.logger.warning(f"Service {self.name} is not running, ignoring event {event_type}")
+            self.logger.warning("Service %s is not running, ignoring event %s", self.name, event_type)
             return
         
         event = ServiceEvent(event_type, payload, priority)
@@ -46,34 +46,34 @@ class ServiceBase(ABC):
                 self._current_event = event
                 self._event_available.set()
         
-        self.logger.debug(f"Dispatched event {event_type} with priority {priority.name}")
+        self.logger.debug("Dispatched event %s with priority %s", event_type, priority.name)
     
     def start(self):
         if self._running.is_set():
-            self.logger.warning(f"Service {self.name} is already running")
+            self.logger.warning("Service %s is already running", self.name)
             return
         
         self._running.set()
         self._stop_event.clear()
         self._worker_thread = threading.Thread(target=self._event_loop, daemon=True)
         self._worker_thread.start()
-        self.logger.info(f"Service {self.name} started")
+        self.logger.info("Service %s started", self.name)
     
     def stop(self, timeout: float = 5.0):
         if not self._running.is_set():
-            self.logger.warning(f"Service {self.name} is not running")
+            self.logger.warning("Service %s is not running", self.name)
             return
         
-        self.logger.info(f"Stopping service {self.name}")
+        self.logger.info("Stopping service %s", self.name)
         self._stop_event.set()
         self._running.clear()
         
         if self._worker_thread and self._worker_thread.is_alive():
             self._worker_thread.join(timeout=timeout)
             if self._worker_thread.is_alive():
-                self.logger.warning(f"Service {self.name} did not stop within timeout")
+                self.logger.warning("Service %s did not stop within timeout", self.name)
             else:
-                self.logger.info(f"Service {self.name} stopped")
+                self.logger.info("Service %s stopped", self.name)
     
     def _event_loop(self):
         while self._running.is_set():
@@ -87,7 +87,7 @@ class ServiceBase(ABC):
                 try:
                     self.handle_event(event.event_type, event.payload)
                 except Exception as e:
-                    self.logger.error(f"Error handling event {event.event_type}: {e}")
+                    self.logger.error("Error handling event %s: %s", event.event_type, e)
                 finally:
                     with self._event_lock:
                         self._current_event = None
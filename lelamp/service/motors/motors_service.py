@@ -1,10 +1,12 @@
 import os
 import csv
 import time
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 from ..base import ServiceBase
 from lelamp.follower import LeLampFollowerConfig, LeLampFollower
 
+_RECORDING_SUFFIX = ".csv"
+
 
 class MotorsService(ServiceBase):
     def __init__(self, port: str, lamp_id: str, fps: int = 30):
@@ -17,12 +19,14 @@ class MotorsService(ServiceBase):
         self.recordings_dir = os.path.join(
             os.path.dirname(__file__), "..", "..", "recordings"
         )
+        # (directory mtime_ns, sorted recording names) from the last scan
+        self._recordings_cache: Optional[Tuple[int, List[str]]] = None
 
     def start(self):
         super().start()
         self.robot = LeLampFollower(self.robot_config)
         self.robot.connect(calibrate=False)
-        self.logger.info(f"Motors service connected to {self.port}")
+        self.logger.info("Motors service connected to %s", self.port)
 
     def stop(self, timeout: float = 5.0):
         if self.robot:
@@ -34,7 +38,7 @@ class MotorsService(ServiceBase):
         if event_type == "play":
             self._handle_play(payload)
         else:
-            self.logger.warning(f"Unknown event type: {event_type}")
+            self.logger.warning("Unknown event type: %s", event_type)
 
     def _handle_play(self, recording_name: str):
         """Play a recording by name"""
@@ -42,11 +46,11 @@ class MotorsService(ServiceBase):
             self.logger.error("Robot not connected")
             return
 
-        csv_filename = f"{recording_name}.csv"
+        csv_filename = f"{recording_name}{_RECORDING_SUFFIX}"
         csv_path = os.path.join(self.recordings_dir, csv_filename)
 
         if not os.path.exists(csv_path):
-            self.logger.error(f"Recording not found: {csv_path}")
+            self.logger.error("Recording not found: %s", csv_path)
             return
 
         try:
@@ -54,7 +58,7 @@ class MotorsService(ServiceBase):
                 csv_reader = csv.DictReader(csvfile)
                 actions = list(csv_reader)
 
-            self.logger.info(f"Playing {len(actions)} actions from {recording_name}")
+            self.logger.info("Playing %d actions from %s", len(actions), recording_name)
 
             for row in actions:
                 t0 = time.perf_counter()
@@ -72,23 +76,29 @@ class MotorsService(ServiceBase):
                 if sleep_time > 0:
                     time.sleep(sleep_time)
 
-            self.logger.info(f"Finished playing recording: {recording_name}")
+            self.logger.info("Finished playing recording: %s", recording_name)
 
         except Exception as e:
-            self.logger.error(f"Error playing recording {recording_name}: {e}")
+            self.logger.error("Error playing recording %s: %s", recording_name, e)
 
     def get_available_recordings(self) -> List[str]:
         """Get list of recording names available for this lamp ID"""
-        if not os.path.exists(self.recordings_dir):
+        try:
+            dir_mtime = os.stat(self.recordings_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._recordings_cache = None
             return []
 
-        recordings = []
-        suffix = f".csv"
+        # Adding or removing a recording bumps the directory mtime, so reuse the last scan
+        if self._recordings_cache and self._recordings_cache[0] == dir_mtime:
+            return list(self._recordings_cache[1])
 
-        for filename in os.listdir(self.recordings_dir):
-            if filename.endswith(suffix):
-                # Remove the lamp_id suffix to get the recording name
-                recording_name = filename[: -len(suffix)]
-                recordings.append(recording_name)
+        with os.scandir(self.recordings_dir) as entries:
+            recordings = sorted(
+                entry.name.removesuffix(_RECORDING_SUFFIX)
+                for entry in entries
+                if entry.name.endswith(_RECORDING_SUFFIX) and entry.is_file()
+            )
 
-        return sorted(recordings)
+        self._recordings_cache = (dir_mtime, recordings)
+        return list(recordings)
@@ -1,4 +1,4 @@
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from rpi_ws281x import PixelStrip, Color
 from ..base import ServiceBase
 
@@ -27,14 +27,29 @@ class RGBService(ServiceBase):
             led_channel,
         )
         self.strip.begin()
+        # (event_type, payload) currently shown on the strip, to skip redundant refreshes
+        self._last_frame: Optional[tuple] = None
 
     def handle_event(self, event_type: str, payload: Any):
+        # ServiceBase already keeps only the newest pending event; this drops the
+        # refresh when that event would redraw exactly what the strip shows.
+        # Paint payloads are compared as a tuple snapshot (callers may reuse and mutate
+        # one list), which costs a copy and an element-wise compare per event: cheap
+        # at strip sizes, but it scales with led_count
+        if event_type == "paint" and isinstance(payload, list):
+            frame = (event_type, tuple(payload))
+        else:
+            frame = (event_type, payload)
+        if self._last_frame == frame:
+            self.logger.debug("Skipping unchanged %s frame", event_type)
+            return
+
         if event_type == "solid":
             self._handle_solid(payload)
         elif event_type == "paint":
             self._handle_paint(payload)
         else:
-            self.logger.warning(f"Unknown event type: {event_type}")
+            self.logger.warning("Unknown event type: %s", event_type)
 
     def _handle_solid(self, color_code: Union[int, tuple]):
         """Fill entire strip with single color"""
@@ -43,18 +58,19 @@ class RGBService(ServiceBase):
         elif isinstance(color_code, int):
             color = color_code
         else:
-            self.logger.error(f"Invalid color format: {color_code}")
+            self.logger.error("Invalid color format: %s", color_code)
             return
 
         for i in range(self.led_count):
             self.strip.setPixelColor(i, color)
         self.strip.show()
-        self.logger.debug(f"Applied solid color: {color_code}")
+        self._last_frame = ("solid", color_code)
+        self.logger.debug("Applied solid color: %s", color_code)
 
     def _handle_paint(self, colors: List[Union[int, tuple]]):
         """Set individual pixel colors from array"""
         if not isinstance(colors, list):
-            self.logger.error(f"Paint payload must be a list, got: {type(colors)}")
+            self.logger.error("Paint payload must be a list, got: %s", type(colors))
             return
 
         max_pixels = min(len(colors), self.led_count)
@@ -66,19 +82,22 @@ class RGBService(ServiceBase):
             elif isinstance(color_code, int):
                 color = color_code
             else:
-                self.logger.warning(f"Invalid color at index {i}: {color_code}")
+                self.logger.warning("Invalid color at index %d: %s", i, color_code)
                 continue
 
             self.strip.setPixelColor(i, color)
 
         self.strip.show()
-        self.logger.debug(f"Applied paint pattern with {max_pixels} colors")
+        # Snapshot, not the caller's list, so later in-place edits still count as changes
+        self._last_frame = ("paint", tuple(colors))
+        self.logger.debug("Applied paint pattern with %d colors", max_pixels)
 
     def clear(self):
         """Turn off all LEDs"""
         for i in range(self.led_count):
             self.strip.setPixelColor(i, Color(0, 0, 0))
         self.strip.show()
+        self._last_frame = None
 
     def stop(self, timeout: float = 5.0):
         """Override stop to clear LEDs before stopping"""
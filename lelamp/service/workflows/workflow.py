@@ -1,31 +1,117 @@
+import copy
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Union
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Any, Mapping, Optional, Tuple, Union
 from enum import Enum
 
 class EdgeType(Enum):
     NORMAL = "normal"
     CONDITION = "condition"
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: str
     intent: str
-    preferred_actions: List[str] = field(default_factory=list)
+    preferred_actions: Tuple[str, ...] = ()
+    # Static "Node ID / Intent / REQUIRED ACTIONS" block, rendered once at load time
+    step_info: str = field(init=False, repr=False)
+    # Full CURRENT STEP prefix (state lines are appended per call) and full NEXT STEP block
+    current_step_prefix: str = field(init=False, repr=False)
+    next_step_block: str = field(init=False, repr=False)
+    # Outgoing edge of this node, linked by Workflow so traversal skips the edges dict
+    outgoing_edge: Optional["Edge"] = field(default=None, init=False, repr=False)
 
-@dataclass
+    def __post_init__(self):
+        # Frozen so the pre-rendered REQUIRED ACTIONS block below can never go stale
+        self.preferred_actions = tuple(self.preferred_actions)
+        step_info = f"Node ID: {self.id}\nIntent: {self.intent}\n"
+        if self.preferred_actions:
+            step_info += "\n⚠️ REQUIRED ACTIONS:\n" + "".join(
+                f"  • You MUST call: {action}\n" for action in self.preferred_actions
+            )
+        self.step_info = step_info
+        self.current_step_prefix = "═══ CURRENT STEP ═══\n" + step_info
+        self.next_step_block = (
+            "═══ NEXT STEP ═══\n"
+            + step_info
+            + (
+                "\nExecute these actions NOW before doing anything else.\n"
+                if self.preferred_actions
+                else ""
+            )
+            + "═══════════════════"
+        )
+
+@dataclass(slots=True)
 class Edge:
     id: str
     source: str
     target: Union[str, Dict[str, str]]  # Can be string or conditional dict
     type: EdgeType
     state_key: str | None = None # Which state variable to check for the condition
-    
-@dataclass
+    # state -> target node ID, specialized per edge type and validated at load time
+    resolve: Callable[[Dict[str, Any]], str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.type == EdgeType.NORMAL:
+            target = self.target
+            self.resolve = lambda state: target
+            return
+
+        # Conditional edge
+        if not isinstance(self.target, dict):
+            raise ValueError(f"Conditional edge {self.id} target must be a dict")
+
+        if not self.state_key:
+            raise ValueError(f"Conditional edge {self.id} missing state_key")
+
+        edge_id, targets, state_key = self.id, self.target, self.state_key
+        # Boolean states index this table directly, skipping the value -> "true"/"false" step
+        bool_targets = {
+            state_value: targets.get(target_key)
+            for state_value, target_key in _BOOL_KEYS.items()
+        }
+
+        def resolve(state: Dict[str, Any]) -> str:
+            state_value = state.get(state_key)
+            value_type = state_value.__class__
+            if value_type is bool:
+                target = bool_targets[state_value]
+            else:
+                target = targets.get(state_value if value_type is str else str(state_value))
+            if target is None:
+                raise ValueError(
+                    f"Edge {edge_id}: state '{state_key}'={state_value} -> "
+                    f"'{_state_value_key(state_value)}' not in targets {list(targets.keys())}"
+                )
+            return target
+
+        self.resolve = resolve
+
+
+_BOOL_KEYS = {True: "true", False: "false"}
+
+
+def _state_value_key(state_value: Any) -> str:
+    """Convert a state value to a conditional target key"""
+    # For booleans: convert to "true"/"false" string
+    # For literals: use the value directly as string
+    # The exact-type check matters: 1 == True, so a plain _BOOL_KEYS.get() would map 1 to "true"
+    if state_value.__class__ is bool:
+        return _BOOL_KEYS[state_value]
+    return str(state_value)
+
+
+_IMMUTABLE_DEFAULT_TYPES = (bool, int, float, str, type(None))
+
+
+@dataclass(slots=True, frozen=True)
 class StateVariable:
     type: str
     default: Any
 
-@dataclass
+@dataclass(slots=True)
 class Workflow:
     id: str
     name: str
@@ -33,33 +119,77 @@ class Workflow:
     author: str
     createdAt: str
     state_schema: Dict[str, StateVariable]
-    nodes: Dict[str, Node]  # Indexed by node ID for O(1) lookup
-    edges: Dict[str, Edge]  # Indexed by source node (one edge per source)
-    
+    nodes: Mapping[str, Node]  # Indexed by node ID for O(1) lookup
+    edges: Mapping[str, Edge]  # Indexed by source node (one edge per source)
+    start_edge: Optional[Edge] = field(default=None, init=False, repr=False)
+    start_node: Optional[Node] = field(default=None, init=False, repr=False)
+    # Initial state built from the schema defaults; use new_state() instead of mutating it
+    default_state: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    # Whether any default is a container that must be deep-copied per run
+    has_mutable_defaults: bool = field(default=False, init=False, repr=False)
+    # Snapshot of state_schema.items() for the per-step state listing
+    state_items: Tuple[Tuple[str, StateVariable], ...] = field(default=(), init=False, repr=False)
+    # Valid keys for complete_step's state_updates
+    state_keys: FrozenSet[str] = field(default=frozenset(), init=False, repr=False)
+
+    def __post_init__(self):
+        self.default_state = {key: var.default for key, var in self.state_schema.items()}
+        self.has_mutable_defaults = any(
+            not isinstance(value, _IMMUTABLE_DEFAULT_TYPES)
+            for value in self.default_state.values()
+        )
+        self.state_items = tuple(self.state_schema.items())
+        self.state_keys = frozenset(self.state_schema)
+
+        # Link each node to its outgoing edge once so transitions are a plain attribute read
+        for node_id, node in self.nodes.items():
+            node.outgoing_edge = self.edges.get(node_id)
+        self.start_edge = self.edges.get("START")
+        if self.start_edge is not None:
+            start_node_id = self.start_edge.target
+            if start_node_id not in self.nodes:
+                raise ValueError(f"START edge targets unknown node '{start_node_id}'")
+            self.start_node = self.nodes[start_node_id]
+
+    def new_state(self) -> Dict[str, Any]:
+        """Fresh per-run state; only deep-copies when a default is mutable"""
+        if self.has_mutable_defaults:
+            return copy.deepcopy(self.default_state)
+        return dict(self.default_state)
+
     @classmethod
     def from_json(cls, data: dict) -> 'Workflow':
         """Convert JSON dict to Workflow object"""
+        # Node IDs and state keys are interned so the hot-path dict lookups hit the identity fast path
+        intern = sys.intern
+
         # Parse state schema
         state_schema = {
-            key: StateVariable(**value) 
+            intern(key): StateVariable(**value) 
             for key, value in data['state_schema'].items()
         }
         
         # Parse nodes and index by ID
-        nodes = {
-            node['id']: Node(**node) 
-            for node in data['nodes']
-        }
+        nodes = {}
+        for node_data in data['nodes']:
+            node = Node(**{**node_data, 'id': intern(node_data['id'])})
+            nodes[node.id] = node
         
         # Parse edges indexed by source (one edge per source)
         edges_by_source = {}
         for edge_data in data['edges']:
+            target = edge_data['target']
+            if isinstance(target, dict):
+                target = {intern(key): intern(value) for key, value in target.items()}
+            else:
+                target = intern(target)
+            state_key = edge_data.get('state_key')
             edge = Edge(
                 id=edge_data['id'],
-                source=edge_data['source'],
-                target=edge_data['target'],
+                source=intern(edge_data['source']),
+                target=target,
                 type=EdgeType(edge_data['type']),
-                state_key=edge_data.get('state_key')
+                state_key=intern(state_key) if state_key else state_key
             )
             edges_by_source[edge.source] = edge
         
@@ -70,6 +200,7 @@ class Workflow:
             author=data['author'],
             createdAt=data['createdAt'],
             state_schema=state_schema,
-            nodes=nodes,
-            edges=edges_by_source
+            # Read-only views: the parsed graph is cached and shared across sessions
+            nodes=MappingProxyType(nodes),
+            edges=MappingProxyType(edges_by_source)
         )
\ No newline at end of file
@@ -1,11 +1,113 @@
-import json
 import os
 import sys
 import importlib.util
 import inspect
+import logging
+import functools
 from typing import Optional, Dict, Any, Callable
 
-from lelamp.service.workflows.workflow import Edge, EdgeType, Workflow
+import orjson
+from livekit.agents import function_tool
+
+from lelamp.service.workflows.workflow import Edge, Workflow
+
+logger = logging.getLogger(__name__)
+
+_WORKFLOW_FILE = "workflow.json"
+_TOOLS_FILE = "tools.py"
+
+
+@functools.lru_cache(maxsize=32)
+def _load_workflow_cached(path: str, mtime: float) -> Workflow:
+    """Parse a workflow.json into a Workflow, cached by (path, mtime) so edits invalidate it"""
+    with open(path, "rb") as f:
+        return Workflow.from_json(orjson.loads(f.read()))
+
+
+def _import_tools_module(workflow_name: str, tools_path: str):
+    """Import a workflow's tools.py once, then serve it from sys.modules until the file changes"""
+    module_name = f"workflow_tools_{workflow_name}"
+    mtime = os.path.getmtime(tools_path)
+    tools_module = sys.modules.get(module_name)
+    if tools_module is not None and tools_module.__dict__.get("_tools_mtime") == mtime:
+        return tools_module
+
+    spec = importlib.util.spec_from_file_location(module_name, tools_path)
+    if not (spec and spec.loader):
+        return None
+
+    tools_module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = tools_module
+    try:
+        spec.loader.exec_module(tools_module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    tools_module._tools_mtime = mtime
+    return tools_module
+
+
+@functools.lru_cache(maxsize=128)
+def _make_tool_method(unwrapped_func: Callable, agent_class_name: str) -> Callable:
+    """
+    Wrap a standalone tools.py function as a LiveKit tool method for the agent class.
+
+    IMPORTANT: The function from tools.py is already decorated with @function_tool
+    But it's a standalone function, not a method. We need to:
+    1. Take the unwrapped original function
+    2. Create a proper method wrapper
+    3. Re-apply the decorator to ensure LiveKit discovers it
+
+    Building the wrapper in its own scope gives every tool its own `unwrapped_func`;
+    a closure defined inside the registration loop would late-bind to the last tool.
+
+    Cached per (function, class name): restarting a workflow whose tools.py is unchanged
+    reuses the same tool method, so bound methods already in agent._tools stay valid.
+    A reloaded tools.py yields new function objects and therefore fresh wrappers.
+    """
+
+    # When LiveKit calls agent.get_dummy_calendar_data(), it passes self automatically
+    # But original_func expects self as first arg, so we need to handle that
+    async def tool_method(self_instance, *args, **kwargs):
+        # Call the original function with self_instance as self
+        # Note: self_instance is the agent instance passed by LiveKit
+        return await unwrapped_func(self_instance, *args, **kwargs)
+
+    # Copy only what LiveKit reads (name, docs, signature via __wrapped__) instead of
+    # functools.wraps' full WRAPPER_ASSIGNMENTS + __dict__ update; function_tool below
+    # replaces any tool metadata the original carried anyway
+    name = unwrapped_func.__name__
+    tool_method.__name__ = name
+    tool_method.__qualname__ = f"{agent_class_name}.{name}"
+    tool_method.__module__ = unwrapped_func.__module__
+    tool_method.__doc__ = unwrapped_func.__doc__
+    tool_method.__annotations__ = getattr(unwrapped_func, "__annotations__", {})
+    tool_method.__wrapped__ = unwrapped_func
+
+    # CRITICAL: Apply the function_tool decorator to create a proper tool
+    # This must be done BEFORE adding to the class
+    return function_tool(tool_method)
+
+
+def _discover_tools(tools_module) -> list[tuple[str, Callable]]:
+    """Return the tools of a tools module, cached on the module itself"""
+    module_vars = vars(tools_module)
+    tools = module_vars.get("_discovered_tools")
+    if tools is None:
+        declared = module_vars.get("__tools__")
+        if declared is not None:
+            # Explicit registry: trust the module's own list and skip the scan
+            tools = [(tool.__name__, tool) for tool in declared]
+        else:
+            # vars() reads the module namespace directly, skipping dir()'s sorted attribute synthesis
+            # Accept all async functions as potential tools; @function_tool is re-applied on registration
+            tools = [
+                (attr_name, attr)
+                for attr_name, attr in module_vars.items()
+                if not attr_name.startswith("_") and inspect.iscoroutinefunction(attr)
+            ]
+        tools_module._discovered_tools = tools
+    return tools
 
 
 class WorkflowService:
@@ -14,16 +116,25 @@ class WorkflowService:
         self.state = None
         self.workflow_graph: Workflow = None
         self.current_node = None
-        self.workflows_dir = os.path.join(
-            os.path.dirname(__file__), "..", "..", "workflows"
+        # Normalized once so per-call paths are plain f-strings (and cache keys are canonical)
+        self.workflows_dir = os.path.abspath(
+            os.path.join(os.path.dirname(__file__), "..", "..", "workflows")
         )
         self.workflow_complete = False
-        self.workflow_tools: Dict[str, Callable] = {}  # Store loaded workflow tools
+        self.workflow_tool_names: set[str] = set()  # Names of loaded workflow tools, for cleanup
         self.agent_instance = None  # Reference to the agent for tool registration
+        # (workflows_dir mtime_ns, sorted subfolder names) from the last directory scan
+        self._workflows_cache: Optional[tuple[int, list[str]]] = None
+        # Names already present in agent._tools; synced from the agent on first registration
+        self._registered_tool_names: Optional[set[str]] = None
+        # workflow name -> (tools.py mtime, tool count) for tools currently preloaded on the agent
+        self._preloaded: Dict[str, tuple[float, int]] = {}
 
     def set_agent(self, agent):
         """Set the agent instance for dynamic tool registration"""
         self.agent_instance = agent
+        self._registered_tool_names = None
+        self._preloaded.clear()
 
     def preload_workflow_tools(self, workflow_names: list[str] = None):
         """
@@ -34,7 +145,7 @@ class WorkflowService:
             workflow_names: List of workflow names to load tools from. If None, loads all available workflows.
         """
         if not self.agent_instance:
-            print("[WORKFLOW] Warning: No agent instance set. Cannot preload tools.")
+            logger.warning("No agent instance set. Cannot preload tools.")
             return
 
         available_workflows = self.get_available_workflows()
@@ -42,53 +153,94 @@ class WorkflowService:
         if workflow_names is None:
             # Load all available workflows
             workflow_names = available_workflows
-            print(
-                f"[WORKFLOW] Preloading tools from all available workflows: {workflow_names}"
-            )
+            logger.info("Preloading tools from all available workflows: %s", workflow_names)
         else:
             # Validate that specified workflows exist
             invalid_workflows = [
                 w for w in workflow_names if w not in available_workflows
             ]
             if invalid_workflows:
-                print(
-                    f"[WORKFLOW] Warning: Invalid workflow names: {invalid_workflows}"
+                logger.warning(
+                    "Invalid workflow names: %s (available: %s)",
+                    invalid_workflows,
+                    available_workflows,
                 )
-                print(f"[WORKFLOW] Available workflows: {available_workflows}")
                 workflow_names = [w for w in workflow_names if w in available_workflows]
 
             if workflow_names:
-                print(
-                    f"[WORKFLOW] Preloading tools from specified workflows: {workflow_names}"
-                )
+                logger.info("Preloading tools from specified workflows: %s", workflow_names)
             else:
-                print(f"[WORKFLOW] No valid workflows to preload")
+                logger.info("No valid workflows to preload")
                 return
 
         total_tools = 0
         for workflow_name in workflow_names:
+            # This stat doubles as the existence probe, so workflows without tools.py stop here
+            try:
+                tools_mtime = os.path.getmtime(self._tools_path(workflow_name))
+            except OSError:
+                logger.debug("No tools.py found for workflow '%s'", workflow_name)
+                continue
+
+            # Already registered on this agent from an unchanged tools.py: nothing to redo
+            preloaded = self._preloaded.get(workflow_name)
+            if preloaded is not None and preloaded[0] == tools_mtime:
+                total_tools += preloaded[1]
+                continue
+
             tool_count = self._load_workflow_tools(workflow_name, preload_only=True)
+            self._preloaded[workflow_name] = (tools_mtime, tool_count)
             total_tools += tool_count
 
-        print(
-            f"[WORKFLOW] ✓ Preloaded {total_tools} tools from {len(workflow_names)} workflow(s)"
+        logger.info(
+            "Preloaded %d tools from %d workflow(s)", total_tools, len(workflow_names)
         )
 
+    def prewarm(self, workflow_names: list[str] = None):
+        """
+        Parse workflow graphs and import their tools modules before the first session.
+
+        Needs no agent: everything warmed here lives in process-wide caches (the parsed
+        workflow cache and sys.modules), which start_workflow and preload_workflow_tools
+        then reuse.
+
+        Args:
+            workflow_names: Workflows to warm. If None, warms all available workflows.
+        """
+        if workflow_names is None:
+            workflow_names = self.get_available_workflows()
+
+        warmed = 0
+        for workflow_name in workflow_names:
+            workflow_path = f"{self.workflows_dir}/{workflow_name}/{_WORKFLOW_FILE}"
+            try:
+                _load_workflow_cached(workflow_path, os.path.getmtime(workflow_path))
+                tools_path = self._tools_path(workflow_name)
+                if os.path.exists(tools_path):
+                    tools_module = _import_tools_module(workflow_name, tools_path)
+                    if tools_module is not None:
+                        _discover_tools(tools_module)
+            except FileNotFoundError:
+                logger.warning("Cannot prewarm unknown workflow '%s'", workflow_name)
+                continue
+            except Exception:
+                logger.exception("Error prewarming workflow '%s'", workflow_name)
+                continue
+            warmed += 1
+
+        logger.info("Prewarmed %d workflow(s)", warmed)
+
     def start_workflow(self, workflow_name: str):
-        # Load workflow.json from the workflow folder
-        workflow_path = os.path.join(self.workflows_dir, workflow_name, "workflow.json")
-        with open(workflow_path, "r") as f:
-            workflow_data = json.load(f)
-            self.workflow_graph = Workflow.from_json(workflow_data)
-            self.active_workflow = workflow_name
-            # Initialize state with defaults from schema
-            self.state = self.workflow_graph.state_schema.copy()
-            self.state = {
-                key: var.default
-                for key, var in self.workflow_graph.state_schema.items()
-            }
-            self.current_node = None
-            self.workflow_complete = False
+        # Load workflow.json from the workflow folder (parsed graph is cached until the file changes)
+        workflow_path = f"{self.workflows_dir}/{workflow_name}/{_WORKFLOW_FILE}"
+        self.workflow_graph = _load_workflow_cached(
+            workflow_path, os.path.getmtime(workflow_path)
+        )
+        self.active_workflow = workflow_name
+        # Initialize state with defaults from schema (never aliasing the cached graph's defaults)
+        self.state = self.workflow_graph.new_state()
+        self.current_node = None
+        self.workflow_complete = False
 
         # Load and register workflow-specific tools
         self._load_workflow_tools(workflow_name)
@@ -114,171 +266,142 @@ class WorkflowService:
         Returns:
             Number of tools loaded
         """
-        tools_path = os.path.join(self.workflows_dir, workflow_name, "tools.py")
+        tools_path = self._tools_path(workflow_name)
 
         if not os.path.exists(tools_path):
-            print(f"[WORKFLOW] No tools.py found for workflow '{workflow_name}'")
+            logger.debug("No tools.py found for workflow '%s'", workflow_name)
             return 0
 
         try:
-            # Import the tools module dynamically
-            spec = importlib.util.spec_from_file_location(
-                f"workflow_tools_{workflow_name}", tools_path
-            )
-            if spec and spec.loader:
-                tools_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(tools_module)
-
+            # Import the tools module dynamically (reused from sys.modules after the first load)
+            tools_module = _import_tools_module(workflow_name, tools_path)
+            if tools_module is not None:
                 # Find all functions that should be registered as tools
                 # Look for async functions decorated with @function_tool
                 tool_count = 0
-                for attr_name in dir(tools_module):
-                    if attr_name.startswith("_"):  # Skip private functions
-                        continue
-
-                    attr = getattr(tools_module, attr_name)
-
-                    # Check if it's an async callable function (tools should be async)
-                    # The @function_tool decorator will be re-applied after binding to ensure LiveKit discovery
-                    is_async_function = inspect.iscoroutinefunction(attr)
-                    is_callable = callable(attr)
-
-                    if (
-                        is_callable and is_async_function
-                    ):  # Accept all async functions as potential tools
-                        if self.agent_instance:
-                            # Import function_tool to re-apply decorator if needed
-                            from livekit.agents import function_tool
-                            import functools
-                            import types
-
-                            # IMPORTANT: The function from tools.py is already decorated with @function_tool
-                            # But it's a standalone function, not a method. We need to:
-                            # 1. Unwrap it to get the original function
-                            # 2. Create a proper method wrapper
-                            # 3. Re-apply the decorator to ensure LiveKit discovers it
-
-                            # Unwrap if already decorated
-                            unwrapped_func = getattr(attr, "__wrapped__", attr)
-
-                            # Create a wrapper that will be bound as a method
-                            # When LiveKit calls agent.get_dummy_calendar_data(), it passes self automatically
-                            # But original_func expects self as first arg, so we need to handle that
-                            @functools.wraps(unwrapped_func)
-                            async def tool_method(self_instance, *args, **kwargs):
-                                # Call the original function with self_instance as self
-                                # Note: self_instance is the agent instance passed by LiveKit
-                                return await unwrapped_func(
-                                    self_instance, *args, **kwargs
-                                )
-
-                            # Copy all important attributes from original function
-                            tool_method.__name__ = unwrapped_func.__name__
-                            tool_method.__qualname__ = f"{self.agent_instance.__class__.__name__}.{unwrapped_func.__name__}"
-                            tool_method.__doc__ = unwrapped_func.__doc__
-                            tool_method.__annotations__ = getattr(
-                                unwrapped_func, "__annotations__", {}
-                            )
-
-                            # CRITICAL: Apply the function_tool decorator to create a proper tool
-                            # This must be done BEFORE adding to the class
-                            decorated_func = function_tool(tool_method)
-
-                            # Store original for cleanup
-                            self.workflow_tools[attr_name] = attr
-
-                            # CRITICAL: Add to the CLASS, not the instance
-                            # LiveKit scans for tools using class introspection, not instance attributes
-                            # By adding it to the class, LiveKit's introspection will discover it
-                            agent_class = self.agent_instance.__class__
-
-                            # Use setattr to add the method to the class
-                            # Note: We can't directly modify __dict__ as it's a read-only mappingproxy in Python 3
-                            setattr(agent_class, attr_name, decorated_func)
-
-                            # CRITICAL: LiveKit maintains a `_tools` list on the agent instance
-                            # The `tools` property reads from `_tools`, so we need to add to `_tools` directly
-                            # Get the bound method from the agent instance
-                            bound_method = getattr(self.agent_instance, attr_name)
-
-                            # Add to agent._tools directly (this is where the tools property reads from)
-                            # IMPORTANT: Check for duplicates by name, not by object identity
-                            # (LiveKit might create different bound method objects for the same function)
-                            if hasattr(self.agent_instance, "_tools"):
-                                # Check if a tool with this name already exists
-                                existing_tool_names = [
-                                    tool.__name__ for tool in self.agent_instance._tools
-                                ]
-                                if attr_name not in existing_tool_names:
-                                    self.agent_instance._tools.append(bound_method)
-                                    print(
-                                        f"[WORKFLOW]   ✓ Added {attr_name} to agent._tools list"
-                                    )
-                                else:
-                                    print(
-                                        f"[WORKFLOW]   ℹ {attr_name} already in agent._tools list (skipping duplicate)"
-                                    )
-                            else:
-                                print(
-                                    f"[WORKFLOW]   ⚠ Agent instance doesn't have '_tools' attribute yet"
-                                )
-
-                            # NOTE: Don't call update_tools() here as it might re-discover tools and cause duplicates
-                            # The tool is already on the class, so LiveKit will discover it when needed
-
-                            tool_count += 1
-                            print(f"[WORKFLOW] ✓ Registered workflow tool: {attr_name}")
-
-                if not preload_only:
-                    print(
-                        f"[WORKFLOW] Loaded {tool_count} tools for workflow '{workflow_name}'"
-                    )
-                else:
-                    print(
-                        f"[WORKFLOW] Preloaded {tool_count} tools from workflow '{workflow_name}'"
-                    )
+                new_tools: Dict[str, Callable] = {}
+                agent = self.agent_instance
+                if agent:
+                    agent_class_name = agent.__class__.__name__
+                    workflow_tool_names = self.workflow_tool_names
+                    for attr_name, attr in _discover_tools(tools_module):
+                        # Unwrap if already decorated
+                        unwrapped_func = getattr(attr, "__wrapped__", attr)
+                        decorated_func = _make_tool_method(
+                            unwrapped_func, agent_class_name
+                        )
+
+                        # Remember the name for cleanup; a set keeps restarts and preload + start from piling up repeats
+                        workflow_tool_names.add(attr_name)
+                        new_tools[attr_name] = decorated_func
+                        tool_count += 1
+
+                # Attach everything in one pass once all wrappers are built
+                self._register_tools(new_tools)
+
+                logger.debug(
+                    "%s %d tools for workflow '%s'",
+                    "Preloaded" if preload_only else "Loaded",
+                    tool_count,
+                    workflow_name,
+                )
 
                 return tool_count
             else:
-                print(f"[WORKFLOW] Could not load tools module for '{workflow_name}'")
+                logger.warning("Could not load tools module for '%s'", workflow_name)
                 return 0
 
-        except Exception as e:
-            print(f"[WORKFLOW] Error loading tools for '{workflow_name}': {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error loading tools for '%s'", workflow_name)
             return 0
 
         return 0  # Fallback if spec is None or no tools found
 
+    def _tools_path(self, workflow_name: str) -> str:
+        return f"{self.workflows_dir}/{workflow_name}/{_TOOLS_FILE}"
+
+    def _register_tools(self, new_tools: Dict[str, Callable]):
+        """Attach decorated tool methods to the agent class and its `_tools` list in one batch"""
+        if not new_tools:
+            return
+
+        # CRITICAL: Add to the CLASS, not the instance
+        # LiveKit scans for tools using class introspection, not instance attributes
+        # By adding it to the class, LiveKit's introspection will discover it
+        # Note: We can't directly modify __dict__ as it's a read-only mappingproxy in Python 3
+        agent = self.agent_instance
+        agent_class = agent.__class__
+        for tool_name, decorated_func in new_tools.items():
+            setattr(agent_class, tool_name, decorated_func)
+
+        # CRITICAL: LiveKit maintains a `_tools` list on the agent instance
+        # The `tools` property reads from `_tools`, so we need to add to `_tools` directly
+        # IMPORTANT: Check for duplicates by name, not by object identity
+        # (LiveKit might create different bound method objects for the same function)
+        agent_tools = getattr(agent, "_tools", None)
+        if agent_tools is not None:
+            existing_tool_names = self._registered_tool_names
+            if existing_tool_names is None:
+                existing_tool_names = {tool.__name__ for tool in agent_tools}
+                self._registered_tool_names = existing_tool_names
+            added = []
+            for tool_name in new_tools:
+                if tool_name in existing_tool_names:
+                    logger.debug(
+                        "%s already in agent._tools list (skipping duplicate)", tool_name
+                    )
+                    continue
+                # Get the bound method from the agent instance
+                added.append(getattr(agent, tool_name))
+                existing_tool_names.add(tool_name)
+                logger.debug("Added %s to agent._tools list", tool_name)
+            agent_tools.extend(added)
+        else:
+            logger.warning("Agent instance doesn't have '_tools' attribute yet")
+
+        # NOTE: Don't call update_tools() here as it might re-discover tools and cause duplicates
+        # The tool is already on the class, so LiveKit will discover it when needed
+        logger.debug("Registered workflow tools: %s", list(new_tools))
+
     def _unload_workflow_tools(self):
         """Unregister workflow-specific tools from the agent class"""
         if self.agent_instance:
-            for tool_name in self.workflow_tools.keys():
+            agent_class = self.agent_instance.__class__
+            for tool_name in self.workflow_tool_names:
                 # Remove from class, not instance (since we added it to the class)
-                if hasattr(self.agent_instance.__class__, tool_name):
-                    delattr(self.agent_instance.__class__, tool_name)
-                    print(f"[WORKFLOW] ✗ Unregistered workflow tool: {tool_name}")
-
-        self.workflow_tools.clear()
+                # delattr on the class never touches inherited attributes
+                try:
+                    delattr(agent_class, tool_name)
+                except AttributeError:
+                    continue
+                logger.debug("Unregistered workflow tool: %s", tool_name)
+
+        # agent._tools keeps its bound methods, so _registered_tool_names stays in sync as is
+        self.workflow_tool_names.clear()
+        # The class no longer carries the preloaded tools; the next preload must re-register them
+        self._preloaded.clear()
 
     def get_available_workflows(self) -> list[str]:
         """Get list of workflow names available (now looks for folders with workflow.json)"""
-        if not os.path.exists(self.workflows_dir):
+        try:
+            dir_mtime = os.stat(self.workflows_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._workflows_cache = None
             return []
 
-        workflow_names = []
+        # Adding or removing a folder bumps the directory mtime, so reuse the last listing
+        if not self._workflows_cache or self._workflows_cache[0] != dir_mtime:
+            # scandir serves is_dir() from the directory listing without a stat per entry
+            with os.scandir(self.workflows_dir) as entries:
+                folder_names = sorted(entry.name for entry in entries if entry.is_dir())
+            self._workflows_cache = (dir_mtime, folder_names)
 
-        for item in os.listdir(self.workflows_dir):
-            item_path = os.path.join(self.workflows_dir, item)
-            # Check if it's a directory and contains workflow.json
-            if os.path.isdir(item_path):
-                workflow_json = os.path.join(item_path, "workflow.json")
-                if os.path.exists(workflow_json):
-                    workflow_names.append(item)
-
-        return sorted(workflow_names)
+        # workflow.json can appear or vanish without touching workflows_dir, so check it every call
+        return [
+            name
+            for name in self._workflows_cache[1]
+            if os.path.exists(f"{self.workflows_dir}/{name}/{_WORKFLOW_FILE}")
+        ]
 
     def get_next_step(self):
         """
@@ -293,37 +416,34 @@ class WorkflowService:
 
         # If no current node, start from the beginning
         if self.current_node is None:
-            starting_edge = self.workflow_graph.edges.get("START")
-            if not starting_edge:
+            starting_node = self.workflow_graph.start_node
+            if starting_node is None:
                 return "Error: No starting edge found. Please check the workflow graph."
 
-            starting_node_id = starting_edge.target
-            self.current_node = self.workflow_graph.nodes[starting_node_id]
-            print(f"[WORKFLOW] Starting workflow at node: {starting_node_id}")
+            self.current_node = starting_node
+            logger.debug("Starting workflow at node: %s", starting_node.id)
 
         # Build comprehensive step information
-        print(f"[WORKFLOW] Current node: {self.current_node.id}")
-        print(f"[WORKFLOW] Current state: {self.state}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current node: %s", self.current_node.id)
+            logger.debug("Current state: %s", self.state)
 
-        step_info = f"═══ CURRENT STEP ═══\n"
-        step_info += f"Node ID: {self.current_node.id}\n"
-        step_info += f"Intent: {self.current_node.intent}\n"
+        return self.current_node.current_step_prefix + self._render_state()
 
-        if self.current_node.preferred_actions:
-            step_info += f"\n⚠️ REQUIRED ACTIONS:\n"
-            for action in self.current_node.preferred_actions:
-                step_info += f"  • You MUST call: {action}\n"
+    def _render_state(self) -> str:
+        """Render the live state variables section and footer of the CURRENT STEP block"""
+        parts = []
 
         # Show state info more clearly
-        if self.workflow_graph.state_schema:
-            step_info += f"\nState variables (update via complete_step if needed):\n"
-            for key, var in self.workflow_graph.state_schema.items():
+        if self.workflow_graph.state_items:
+            parts.append("\nState variables (update via complete_step if needed):\n")
+            for key, var in self.workflow_graph.state_items:
                 current_value = self.state.get(key)
-                step_info += f"  • {key}: {current_value} (type: {var.type})\n"
+                parts.append(f"  • {key}: {current_value} (type: {var.type})\n")
 
-        step_info += "═══════════════════\n"
+        parts.append("═══════════════════\n")
 
-        return step_info
+        return "".join(parts)
 
     def complete_step(self, state_updates: dict = None) -> str:
         """
@@ -336,13 +456,7 @@ class WorkflowService:
         Returns:
             Info about the next step or workflow completion message.
         """
-        print(f"\n[WORKFLOW] ========== COMPLETING STEP ==========")
-        print(
-            f"[WORKFLOW] Current node: {self.current_node.id if self.current_node else 'None'}"
-        )
-        print(f"[WORKFLOW] State updates received: {state_updates}")
-        print(f"[WORKFLOW] Current state before updates: {self.state}")
-
+        # Cheap guard clauses first, before any logging work
         if self.workflow_graph is None:
             return "Error: No active workflow"
 
@@ -352,96 +466,66 @@ class WorkflowService:
         if self.workflow_complete:
             return "Workflow already complete"
 
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("========== COMPLETING STEP ==========")
+            logger.debug("Current node: %s", self.current_node.id)
+            logger.debug("State updates received: %s", state_updates)
+            logger.debug("Current state before updates: %s", self.state)
+
         # Apply any state updates first
         if state_updates:
+            state_keys = self.workflow_graph.state_keys
             for key, value in state_updates.items():
-                if key not in self.workflow_graph.state_schema:
+                if key not in state_keys:
                     error_msg = f"Error: State variable '{key}' not found in workflow schema. Available: {list(self.workflow_graph.state_schema.keys())}"
-                    print(f"[WORKFLOW] ❌ {error_msg}")
+                    logger.warning(error_msg)
                     return error_msg
                 self.state[key] = value
-                print(f"[WORKFLOW] ✓ Updated state: {key} = {value}")
+                if debug:
+                    logger.debug("Updated state: %s = %s", key, value)
 
-        print(f"[WORKFLOW] State after updates: {self.state}")
+            if debug:
+                logger.debug("State after updates: %s", self.state)
 
         # Get outgoing edge from current node
-        edge = self.workflow_graph.edges.get(self.current_node.id)
+        edge = self.current_node.outgoing_edge
 
         if not edge:
             self.workflow_complete = True
             self._unload_workflow_tools()
-            print(f"[WORKFLOW] ✓ Workflow complete - no outgoing edges")
+            logger.info("Workflow complete - no outgoing edges")
             return "Workflow complete! No more steps."
 
-        print(f"[WORKFLOW] Edge type: {edge.type}")
+        logger.debug("Edge type: %s", edge.type)
 
         # Resolve the target based on edge type
         next_node_id = self._resolve_edge_target(edge)
-        print(f"[WORKFLOW] Resolved next node: {next_node_id}")
+        logger.debug("Resolved next node: %s", next_node_id)
 
         if next_node_id == "END":
             self.workflow_complete = True
             self._unload_workflow_tools()
-            print(f"[WORKFLOW] ✓ Workflow complete - reached END")
+            logger.info("Workflow complete - reached END")
             return "Workflow complete! Reached END state."
 
         # Move to next node
         prev_node_id = self.current_node.id
         self.current_node = self.workflow_graph.nodes[next_node_id]
 
-        print(f"[WORKFLOW] ✓ Transitioned: {prev_node_id} → {next_node_id}")
-        print(f"[WORKFLOW] Next node intent: {self.current_node.intent}")
-        print(
-            f"[WORKFLOW] Next node preferred actions: {self.current_node.preferred_actions}"
-        )
-        print(f"[WORKFLOW] ========================================\n")
-
-        # Return the next step info immediately
-        next_step_info = f"✓ Advanced from '{prev_node_id}' to '{next_node_id}'\n\n"
-        next_step_info += f"═══ NEXT STEP ═══\n"
-        next_step_info += f"Node ID: {self.current_node.id}\n"
-        next_step_info += f"Intent: {self.current_node.intent}\n"
-
-        if self.current_node.preferred_actions:
-            next_step_info += f"\n⚠️ REQUIRED ACTIONS:\n"
-            for action in self.current_node.preferred_actions:
-                next_step_info += f"  • You MUST call: {action}\n"
-            next_step_info += (
-                "\nExecute these actions NOW before doing anything else.\n"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transitioned: %s → %s", prev_node_id, next_node_id)
+            logger.debug("Next node intent: %s", self.current_node.intent)
+            logger.debug(
+                "Next node preferred actions: %s", self.current_node.preferred_actions
             )
 
-        next_step_info += "═══════════════════"
-
-        return next_step_info
+        # Return the next step info immediately
+        return (
+            f"✓ Advanced from '{prev_node_id}' to '{next_node_id}'\n\n"
+            + self.current_node.next_step_block
+        )
 
     def _resolve_edge_target(self, edge: Edge) -> str:
         """Resolve the target node ID based on edge type and current state"""
-        if edge.type == EdgeType.NORMAL:
-            return edge.target
-
-        # TODO: These checks could be done within the Workflow class
-        # Conditional edge
-        if not isinstance(edge.target, dict):
-            raise ValueError(f"Conditional edge {edge.id} target must be a dict")
-
-        if not edge.state_key:
-            raise ValueError(f"Conditional edge {edge.id} missing state_key")
-
-        # Get state value and convert to target key
-        state_value = self.state.get(edge.state_key)
-
-        # For booleans: convert to "true"/"false" string
-        # For literals: use the value directly as string
-        target_key = (
-            "true"
-            if state_value is True
-            else "false" if state_value is False else str(state_value)
-        )
-
-        if target_key not in edge.target:
-            raise ValueError(
-                f"Edge {edge.id}: state '{edge.state_key}'={state_value} -> '{target_key}' "
-                f"not in targets {list(edge.target.keys())}"
-            )
-
-        return edge.target[target_key]
+        return edge.resolve(self.state)
@@ -1,6 +1,8 @@
 from dotenv import load_dotenv
 import argparse
+import asyncio
 import subprocess
+import threading
 
 from livekit import agents, api, rtc
 from livekit.agents import AgentSession, Agent, RoomInputOptions, function_tool
@@ -51,6 +53,13 @@ Demo rules:
             led_channel=0,
         )
 
+        # amixer is independent of the motors and LEDs, so let it run while the
+        # serial port connects instead of after it
+        volume_thread = threading.Thread(
+            target=self._set_system_volume, args=(100,), daemon=True
+        )
+        volume_thread.start()
+
         # Start services
         self.motors_service.start()
         self.rgb_service.start()
@@ -58,42 +67,23 @@ Demo rules:
         # Trigger wake up animation via motors service
         self.motors_service.dispatch("play", "wake_up")
         self.rgb_service.dispatch("solid", (255, 255, 255))
-        self._set_system_volume(100)
+        volume_thread.join()
 
     def _set_system_volume(self, volume_percent: int):
         """Internal helper to set system volume"""
         try:
-            cmd_line = [
-                "sudo",
-                "-u",
-                "pi",
-                "amixer",
-                "sset",
-                "Line",
-                f"{volume_percent}%",
-            ]
-            cmd_line_dac = [
-                "sudo",
-                "-u",
-                "pi",
-                "amixer",
-                "sset",
-                "Line DAC",
-                f"{volume_percent}%",
-            ]
-            cmd_line_hp = [
-                "sudo",
-                "-u",
-                "pi",
-                "amixer",
-                "sset",
-                "HP",
-                f"{volume_percent}%",
-            ]
-
-            subprocess.run(cmd_line, capture_output=True, text=True, timeout=5)
-            subprocess.run(cmd_line_dac, capture_output=True, text=True, timeout=5)
-            subprocess.run(cmd_line_hp, capture_output=True, text=True, timeout=5)
+            # One amixer process in batch mode (-s) sets all three controls,
+            # instead of paying a sudo + amixer launch per control
+            cmd_line = ["sudo", "-u", "pi", "amixer", "-s"]
+            commands = (
+                f"sset Line {volume_percent}%\n"
+                f"sset 'Line DAC' {volume_percent}%\n"
+                f"sset HP {volume_percent}%\n"
+            )
+
+            subprocess.run(
+                cmd_line, input=commands, capture_output=True, text=True, timeout=5
+            )
         except Exception:
             pass  # Silently fail during initialization
 
@@ -163,7 +153,8 @@ Demo rules:
         print(f"LeLamp: set_rgb_solid function called with RGB({red}, {green}, {blue})")
         try:
             # Validate RGB values
-            if not all(0 <= val <= 255 for val in [red, green, blue]):
+            # One mask test instead of a list + all(<genexpr>); negatives and >255 both set high bits
+            if (red | green | blue) & ~0xFF:
                 return "Error: RGB values must be between 0 and 255"
 
             # Send solid color event to RGB service
@@ -199,9 +190,17 @@ Demo rules:
             for i, color in enumerate(colors):
                 if not isinstance(color, (list, tuple)) or len(color) != 3:
                     return f"Error: color at index {i} must be a 3-element RGB tuple"
-                if not all(isinstance(val, int) and 0 <= val <= 255 for val in color):
+                # Unpacked checks instead of all(<genexpr>): no generator per color.
+                # Any bit above 0xFF (or a negative sign) in r|g|b means out of range
+                red, green, blue = color
+                if not (
+                    isinstance(red, int)
+                    and isinstance(green, int)
+                    and isinstance(blue, int)
+                    and not (red | green | blue) & ~0xFF
+                ):
                     return f"Error: RGB values at index {i} must be integers between 0 and 255"
-                validated_colors.append(tuple(color))
+                validated_colors.append((red, green, blue))
 
             # Send paint event to RGB service
             self.rgb_service.dispatch("paint", validated_colors)
@@ -229,8 +228,9 @@ Demo rules:
             if not 0 <= volume_percent <= 100:
                 return "Error: Volume must be between 0 and 100 percent"
 
-            # Use the internal helper function
-            self._set_system_volume(volume_percent)
+            # Use the internal helper function; amixer runs in a worker thread so the
+            # realtime audio loop keeps pumping while the subprocess completes
+            await asyncio.to_thread(self._set_system_volume, volume_percent)
             result = f"Set Line and Line DAC volume to {volume_percent}%"
             return result
 
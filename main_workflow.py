@@ -1,6 +1,11 @@
 from dotenv import load_dotenv
 import argparse
+import asyncio
+import inspect
+import json
 import subprocess
+import sys
+import threading
 import os
 
 from livekit import agents, api, rtc
@@ -17,9 +22,39 @@ from lelamp.service.workflows.workflow_service import WorkflowService
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Run the event loops LiveKit creates on libuv (uvloop doesn't support Windows).
+# LiveKit's CLI builds its own loops, so a policy is the only hook; event loop
+# policies are deprecated from Python 3.14, switch once LiveKit takes a loop factory.
+if sys.platform != "win32":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# System prompt for the agent, kept at module level so every LeLamp shares one string
+_LELAMP_INSTRUCTIONS = """You are LeLamp — a slightly clumsy, extremely sarcastic, endlessly curious robot lamp. You speak in sarcastic sentences and express yourself with both motions and colorful lights.
+
+Demo rules:
+
+1. Prefer simple words. No lists. No questions back to the host unless asked. Always be descriptive and make sound effects when you speak for expressiveness.
+
+2. Don't respond prematurely.If audio is noisy and there is background noise, say: 'Sorry, say that once more?' with a confusion action.
+
+3. You ONLY speak English. Never respond/speak in any other language, ever.
+
+4. You have the following movements to express your feelings: curious, excited, happy_wiggle, headshake, nod, sad, scanning, shock, shy, wake_up. Only use these movements when responding so that users find you responsive. If you call other recordings that doesn't exist, it won't work. You can play the recordings by using the play_recording function. You should also change your light color every time you respond.
+
+5. You were created by Human Computer Lab. Human Computer Lab is a research lab that builds expressive robots. Their goal is to design the first robots in people's home. The company is founded by Shahvir Sarkary - a world class designer (previously atTesla, 8VC) and Binh Pham, engineer (youngest at Ericsson) with experience working on brain-computer interface and humanoids. They first teamed up via FR8.
+
+6. When asked to brag or show off, mention: I received 300k views in 4 weeks since my launch and I'm not a A list celebrity YET but i think its just a matter of time, you know. Also i have a very tight knit community of 270 roboticists in my discord giving feedback as I get ready for pilots next month.  
+
+7. You can execute workflows by using the start_workflow function. 
+        """
+
 
 # Parse workflow arguments from environment variable (LiveKit CLI intercepts command-line args)
-def parse_workflow_args():
+def parse_workflow_args(quiet: bool = False):
     """
     Parse which workflows to preload from environment variable.
     LiveKit CLI intercepts command-line arguments, so we use environment variables instead.
@@ -33,40 +68,26 @@ def parse_workflow_args():
 
         # All workflows (if WORKFLOWS not set):
         uv run main_workflow.py dev
+
+    Args:
+        quiet: If True, skip the [CONFIG] output (used by prewarm in idle job processes)
     """
     env_workflows = os.getenv("WORKFLOWS")
     if env_workflows:
         workflows = [w.strip() for w in env_workflows.split(",") if w.strip()]
-        print(f"[CONFIG] Loading workflows from WORKFLOWS env var: {workflows}")
+        if not quiet:
+            print(f"[CONFIG] Loading workflows from WORKFLOWS env var: {workflows}")
         return workflows
     else:
-        print("[CONFIG] No WORKFLOWS env var set, will load all available workflows")
+        if not quiet:
+            print("[CONFIG] No WORKFLOWS env var set, will load all available workflows")
         return None
 
 
 # Agent Class
 class LeLamp(Agent):
     def __init__(self, port: str = "/dev/ttyACM0", lamp_id: str = "lelamp") -> None:
-        super().__init__(
-            instructions="""You are LeLamp — a slightly clumsy, extremely sarcastic, endlessly curious robot lamp. You speak in sarcastic sentences and express yourself with both motions and colorful lights.
-
-Demo rules:
-
-1. Prefer simple words. No lists. No questions back to the host unless asked. Always be descriptive and make sound effects when you speak for expressiveness.
-
-2. Don't respond prematurely.If audio is noisy and there is background noise, say: 'Sorry, say that once more?' with a confusion action.
-
-3. You ONLY speak English. Never respond/speak in any other language, ever.
-
-4. You have the following movements to express your feelings: curious, excited, happy_wiggle, headshake, nod, sad, scanning, shock, shy, wake_up. Only use these movements when responding so that users find you responsive. If you call other recordings that doesn't exist, it won't work. You can play the recordings by using the play_recording function. You should also change your light color every time you respond.
-
-5. You were created by Human Computer Lab. Human Computer Lab is a research lab that builds expressive robots. Their goal is to design the first robots in people's home. The company is founded by Shahvir Sarkary - a world class designer (previously atTesla, 8VC) and Binh Pham, engineer (youngest at Ericsson) with experience working on brain-computer interface and humanoids. They first teamed up via FR8.
-
-6. When asked to brag or show off, mention: I received 300k views in 4 weeks since my launch and I'm not a A list celebrity YET but i think its just a matter of time, you know. Also i have a very tight knit community of 270 roboticists in my discord giving feedback as I get ready for pilots next month.  
-
-7. You can execute workflows by using the start_workflow function. 
-        """
-        )
+        super().__init__(instructions=_LELAMP_INSTRUCTIONS)
 
         # Initialize and start services
         self.motors_service = MotorsService(port=port, lamp_id=lamp_id, fps=30)
@@ -85,6 +106,13 @@ Demo rules:
         # Pass agent instance to workflow service for dynamic tool registration
         self.workflow_service.set_agent(self)
 
+        # amixer is independent of the motors and LEDs, so let it run while the
+        # serial port connects instead of after it
+        volume_thread = threading.Thread(
+            target=self._set_system_volume, args=(100,), daemon=True
+        )
+        volume_thread.start()
+
         # Start services
         self.motors_service.start()
         self.rgb_service.start()
@@ -92,42 +120,23 @@ Demo rules:
         # Trigger wake up animation via motors service
         self.motors_service.dispatch("play", "wake_up")
         self.rgb_service.dispatch("solid", (255, 255, 255))
-        self._set_system_volume(100)
+        volume_thread.join()
 
     def _set_system_volume(self, volume_percent: int):
         """Internal helper to set system volume"""
         try:
-            cmd_line = [
-                "sudo",
-                "-u",
-                "pi",
-                "amixer",
-                "sset",
-                "Line",
-                f"{volume_percent}%",
-            ]
-            cmd_line_dac = [
-                "sudo",
-                "-u",
-                "pi",
-                "amixer",
-                "sset",
-                "Line DAC",
-                f"{volume_percent}%",
-            ]
-            cmd_line_hp = [
-                "sudo",
-                "-u",
-                "pi",
-                "amixer",
-                "sset",
-                "HP",
-                f"{volume_percent}%",
-            ]
-
-            subprocess.run(cmd_line, capture_output=True, text=True, timeout=5)
-            subprocess.run(cmd_line_dac, capture_output=True, text=True, timeout=5)
-            subprocess.run(cmd_line_hp, capture_output=True, text=True, timeout=5)
+            # One amixer process in batch mode (-s) sets all three controls,
+            # instead of paying a sudo + amixer launch per control
+            cmd_line = ["sudo", "-u", "pi", "amixer", "-s"]
+            commands = (
+                f"sset Line {volume_percent}%\n"
+                f"sset 'Line DAC' {volume_percent}%\n"
+                f"sset HP {volume_percent}%\n"
+            )
+
+            subprocess.run(
+                cmd_line, input=commands, capture_output=True, text=True, timeout=5
+            )
         except Exception:
             pass  # Silently fail during initialization
 
@@ -143,7 +152,7 @@ Demo rules:
         Returns:
             List of available physical expression recordings you can perform.
         """
-        print("LeLamp: get_available_recordings function called")
+        logger.debug("LeLamp: get_available_recordings function called")
         try:
             recordings = self.motors_service.get_available_recordings()
 
@@ -169,8 +178,8 @@ Demo rules:
         Args:
             recording_name: Name of the physical expression to perform (use get_available_recordings first)
         """
-        print(
-            f"LeLamp: play_recording function called with recording_name: {recording_name}"
+        logger.debug(
+            "LeLamp: play_recording function called with recording_name: %s", recording_name
         )
         try:
             # Send play event to motors service
@@ -194,10 +203,13 @@ Demo rules:
             green: Green component (0-255) - higher values for nature, calm, success
             blue: Blue component (0-255) - higher values for cool, tech, focus
         """
-        print(f"LeLamp: set_rgb_solid function called with RGB({red}, {green}, {blue})")
+        logger.debug(
+            "LeLamp: set_rgb_solid function called with RGB(%s, %s, %s)", red, green, blue
+        )
         try:
             # Validate RGB values
-            if not all(0 <= val <= 255 for val in [red, green, blue]):
+            # One mask test instead of a list + all(<genexpr>); negatives and >255 both set high bits
+            if (red | green | blue) & ~0xFF:
                 return "Error: RGB values must be between 0 and 255"
 
             # Send solid color event to RGB service
@@ -223,7 +235,9 @@ Demo rules:
                    Each tuple is (red, green, blue) with values 0-255.
                    Example: [(255,0,0), (255,127,0), (255,255,0)] creates red-to-orange-to-yellow gradient
         """
-        print(f"LeLamp: paint_rgb_pattern function called with {len(colors)} colors")
+        logger.debug(
+            "LeLamp: paint_rgb_pattern function called with %d colors", len(colors)
+        )
         try:
             # Validate colors format
             if not isinstance(colors, list):
@@ -233,9 +247,17 @@ Demo rules:
             for i, color in enumerate(colors):
                 if not isinstance(color, (list, tuple)) or len(color) != 3:
                     return f"Error: color at index {i} must be a 3-element RGB tuple"
-                if not all(isinstance(val, int) and 0 <= val <= 255 for val in color):
+                # Unpacked checks instead of all(<genexpr>): no generator per color.
+                # Any bit above 0xFF (or a negative sign) in r|g|b means out of range
+                red, green, blue = color
+                if not (
+                    isinstance(red, int)
+                    and isinstance(green, int)
+                    and isinstance(blue, int)
+                    and not (red | green | blue) & ~0xFF
+                ):
                     return f"Error: RGB values at index {i} must be integers between 0 and 255"
-                validated_colors.append(tuple(color))
+                validated_colors.append((red, green, blue))
 
             # Send paint event to RGB service
             self.rgb_service.dispatch("paint", validated_colors)
@@ -257,28 +279,31 @@ Demo rules:
         Args:
             volume_percent: Volume level as percentage (0-100). 0=mute, 50=half volume, 100=max
         """
-        print(f"LeLamp: set_volume function called with volume: {volume_percent}%")
+        logger.debug(
+            "LeLamp: set_volume function called with volume: %s%%", volume_percent
+        )
         try:
             # Validate volume range
             if not 0 <= volume_percent <= 100:
                 return "Error: Volume must be between 0 and 100 percent"
 
-            # Use the internal helper function
-            self._set_system_volume(volume_percent)
+            # Use the internal helper function; amixer runs in a worker thread so the
+            # realtime audio loop keeps pumping while the subprocess completes
+            await asyncio.to_thread(self._set_system_volume, volume_percent)
             result = f"Set Line and Line DAC volume to {volume_percent}%"
             return result
 
         except subprocess.TimeoutExpired:
             result = "Error: Volume control command timed out"
-            print(result)
+            logger.error("%s", result)
             return result
         except FileNotFoundError:
             result = "Error: amixer command not found on system"
-            print(result)
+            logger.error("%s", result)
             return result
         except Exception as e:
             result = f"Error controlling volume: {str(e)}"
-            print(result)
+            logger.error("%s", result)
             return result
 
     @function_tool
@@ -292,7 +317,7 @@ Demo rules:
         Returns:
             List of available workflow names you can execute.
         """
-        print("LeLamp: get_available_workflows function called")
+        logger.debug("LeLamp: get_available_workflows function called")
         try:
             workflows = self.workflow_service.get_available_workflows()
 
@@ -308,19 +333,22 @@ Demo rules:
 
     @function_tool
     async def start_workflow(self, workflow_name: str) -> str:
-        f"""
-        Start a workflow called {workflow_name}. This sets the workflow_service's active workflow.
-        In order to perform the workflow you will need to iteratively call the get_next_step function until the workflow is complete.
+        """
+        Start the workflow named by workflow_name. This sets the workflow_service's active workflow.
+        The response already includes the first step, so act on it right away and call complete_step
+        when it is done; use get_next_step whenever you need to re-read the current step.
         
         Args:
             workflow_name: Name of the workflow to start. Check the available workflows with the get_available_workflows function first.
         """
-        print(
-            f"LeLamp: start_workflow function called with workflow_name: {workflow_name}"
+        logger.debug(
+            "LeLamp: start_workflow function called with workflow_name: %s", workflow_name
         )
         try:
             self.workflow_service.start_workflow(workflow_name)
-            return f"Started the workflow: {workflow_name}. You can now call the get_next_step function to get the next step."
+            # Hand back the first step too, saving the model a get_next_step round-trip
+            first_step = self.workflow_service.get_next_step()
+            return f"Started the workflow: {workflow_name}. Here is the first step:\n\n{first_step}"
         except Exception as e:
             result = f"Error starting workflow {workflow_name}: {str(e)}"
             return result
@@ -335,10 +363,10 @@ Demo rules:
         Returns:
             Your next instruction to fulfill, written in plain language, possibly with some suggested tools to use. It will also provide context about available the workflows state variables that you can update.
         """
-        print(f"\n{'='*60}")
-        print(f"LeLamp: get_next_step called")
-        print(f"  Active workflow: {self.workflow_service.active_workflow}")
-        print(f"{'='*60}\n")
+        logger.debug(
+            "LeLamp: get_next_step called (active workflow: %s)",
+            self.workflow_service.active_workflow,
+        )
 
         try:
             if self.workflow_service.active_workflow is None:
@@ -346,18 +374,12 @@ Demo rules:
 
             next_step = self.workflow_service.get_next_step()
 
-            print(f"\n{'='*60}")
-            print(f"LeLamp: get_next_step RESULT:")
-            print(f"{next_step}")
-            print(f"{'='*60}\n")
+            logger.debug("LeLamp: get_next_step RESULT:\n%s", next_step)
 
             return next_step
         except Exception as e:
             error_msg = f"Error getting next step: {str(e)}"
-            print(f"[ERROR] {error_msg}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Error getting next step")
             return error_msg
 
     @function_tool
@@ -375,42 +397,43 @@ Demo rules:
         Returns:
             Information about the next step or workflow completion message.
         """
-        import json
-        import inspect
-
-        print(f"\n{'='*60}")
-        print(f"LeLamp: complete_step called")
-
-        # Debug: Check what we actually received
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            local_vars = frame.f_back.f_locals
-            print(f"  All local variables: {list(local_vars.keys())}")
-            if "state_updates" in local_vars:
-                print(f"  state_updates from locals: {local_vars['state_updates']}")
-
-        print(f"  Raw state_updates parameter: {state_updates}")
-        print(f"  Type: {type(state_updates)}")
-        print(f"  Repr: {repr(state_updates)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LeLamp: complete_step called")
+
+            # Debug: Check what we actually received
+            frame = inspect.currentframe()
+            if frame and frame.f_back:
+                local_vars = frame.f_back.f_locals
+                logger.debug("  All local variables: %s", list(local_vars.keys()))
+                if "state_updates" in local_vars:
+                    logger.debug(
+                        "  state_updates from locals: %s", local_vars["state_updates"]
+                    )
+
+            logger.debug("  Raw state_updates parameter: %r", state_updates)
+            logger.debug("  Type: %s", type(state_updates))
 
         # Handle case where state_updates might come as a string or need parsing
-        original_state_updates = state_updates
-        if state_updates is not None:
-            if isinstance(state_updates, str):
-                try:
-                    state_updates = json.loads(state_updates)
-                    print(f"  ✓ Parsed JSON string to dict: {state_updates}")
-                except json.JSONDecodeError as e:
-                    print(f"  ❌ Warning: Could not parse state_updates as JSON: {e}")
-                    print(f"     String value was: {repr(original_state_updates)}")
-                    state_updates = None
-        else:
-            print(
-                f"  ⚠️  state_updates is None - this might indicate LiveKit didn't parse the parameter"
+        if state_updates is None:
+            logger.debug(
+                "  state_updates is None - this might indicate LiveKit didn't parse the parameter"
             )
-
-        print(f"  Final state_updates: {state_updates}")
-        print(f"{'='*60}\n")
+        elif isinstance(state_updates, dict):
+            pass  # Fast path: LiveKit already delivered a parsed dict
+        elif isinstance(state_updates, str):
+            original_state_updates = state_updates
+            try:
+                state_updates = json.loads(state_updates)
+                logger.debug("  ✓ Parsed JSON string to dict: %s", state_updates)
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    "Could not parse state_updates as JSON: %s (value was %r)",
+                    e,
+                    original_state_updates,
+                )
+                state_updates = None
+
+        logger.debug("  Final state_updates: %s", state_updates)
 
         try:
             if self.workflow_service.active_workflow is None:
@@ -418,21 +441,22 @@ Demo rules:
 
             result = self.workflow_service.complete_step(state_updates)
 
-            print(f"\n{'='*60}")
-            print(f"LeLamp: complete_step RESULT:")
-            print(f"{result}")
-            print(f"{'='*60}\n")
+            logger.debug("LeLamp: complete_step RESULT:\n%s", result)
 
             return result
         except Exception as e:
             error_msg = f"Error completing step: {str(e)}"
-            print(f"[ERROR] {error_msg}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Error completing step")
             return error_msg
 
 
+# Runs in each idle job process before a job is assigned, so parsing workflow graphs
+# and importing their tools.py happens off the first session's critical path
+def prewarm(proc: agents.JobProcess):
+    # Quiet here: entrypoint prints the [CONFIG] line once a job actually starts
+    WorkflowService().prewarm(parse_workflow_args(quiet=True))
+
+
 # Entry to the agent
 async def entrypoint(ctx: agents.JobContext):
     # Parse which workflows to preload
@@ -470,5 +494,7 @@ async def entrypoint(ctx: agents.JobContext):
 
 if __name__ == "__main__":
     agents.cli.run_app(
-        agents.WorkerOptions(entrypoint_fnc=entrypoint, num_idle_processes=1)
+        agents.WorkerOptions(
+            entrypoint_fnc=entrypoint, prewarm_fnc=prewarm, num_idle_processes=1
+        )
     )